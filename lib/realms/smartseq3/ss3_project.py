@@ -231,10 +231,9 @@ class SmartSeq3(AbstractProject):
         # Iterate over all samples in the project doc
         for sample_id, sample_data in self.doc.get("samples", {}).items():
             # 1) Check if the manual status in the project doc is "aborted"
-            manual_status = (
-                sample_data.get("details", {}).get("status_(manual)", "").lower()
-            )
-            if manual_status == "aborted":
+            details = sample_data.get("details")
+            manual_status = details.get("status_(manual)") if details else None
+            if manual_status and manual_status.lower() == "aborted":
                 self._logger.info(
                     f"Skipping sample '{sample_id}' => status '{manual_status}'"
                 )
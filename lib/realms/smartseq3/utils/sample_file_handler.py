@@ -1,6 +1,9 @@
-import glob
 import logging
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 
 from lib.core_utils.logging_utils import custom_logger
@@ -8,12 +11,55 @@ from lib.realms.smartseq3.utils.ss3_utils import SS3Utils
 
 logger = custom_logger(__name__)
 
+# FASTQ file name marker (_R1_, _R2_, _I1_, _I2_); the group is the read slot it fills
+_FASTQ_SLOT_RE = re.compile(r"_([RI][12])_")
+
+
+def _dir_entries(path):
+    """
+    List the entries of a directory with a single scandir call.
+
+    Args:
+        path (str or Path): Directory to list.
+
+    Returns:
+        dict or None: Entry names mapped to whether the entry is a symlink. Empty if the
+            directory does not exist, None if it exists but cannot be listed.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_symlink() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    except OSError:
+        return None
+
+
+def _is_present(path, entries):
+    """
+    Check a path against the listing of its parent directory.
+
+    Symlinks and unlistable directories fall back to stat, so the result matches Path.exists().
+
+    Args:
+        path (Path): File to check.
+        entries (dict or None): Listing of ``path.parent`` as returned by ``_dir_entries``.
+
+    Returns:
+        bool: True if the path exists, False otherwise.
+    """
+    if entries is None or entries.get(path.name):
+        return path.exists()
+    return path.name in entries
+
 
 class SampleFileHandler:
     """
     Handles file operations for a SmartSeq3 sample, including managing file paths, creating necessary directories,
     ensuring barcode files exist, locating reference and FASTQ files, creating symlinks, validating output files, etc.
 
+    All Path attributes except project_dir are cached properties, so a Path is only built for the fields a step reads.
+
     Attributes:
         sample_id (str): Identifier for the sample.
         plate (str): Identifier for the plate.
@@ -23,7 +69,7 @@ class SampleFileHandler:
         project_name (str): Name of the project.
         sample_ref (str): Reference genome for the sample.
         config (dict): Configuration settings.
-        base_dir (Path): Base directory path for the project.
+        project_dir (Path): Base directory path for the project.
         sample_dir (Path): Directory path for the sample.
         zumis_output_dir (Path): Directory path for zUMIs output.
         stats_dir (Path): Directory path for zUMIs stats.
@@ -31,6 +77,10 @@ class SampleFileHandler:
         fastq_files_dir (Path): Directory path for FASTQ files.
         plots_dir (Path): Directory path for plots.
         fastq_files (dict): Dictionary of FASTQ file paths.
+        barcode_fpath (Path): Barcode file used by zUMIs.
+        barcode_lookup_fpath (Path): Lookup table used to create a missing barcode file.
+        features_plot_fpath (Path): zUMIs features plot, used in the report.
+        report_fpath (Path): Generated sample report.
     """
 
     # TODO: Only pass the project_name if project_info is not used anywhere else
@@ -59,48 +109,89 @@ class SampleFileHandler:
 
         # Define sample folder structure
         self.project_dir = sample.project_info.get("project_dir", "")
-        self.sample_dir = self.project_dir / self.sample_id
-        self.zumis_output_dir = self.sample_dir / "zUMIs_output"
-        self.stats_dir = self.sample_dir / "zUMIs_output" / "stats"
-        self.expression_dir = self.sample_dir / "zUMIs_output" / "expression"
-        self.fastq_files_dir = self.sample_dir / "fastq_files"
-        self.plots_dir = self.sample_dir / "plots"
 
         # Initialize fastq files
         self.fastq_files = {"R1": None, "R2": None, "I1": None, "I2": None}
 
-        # Define critical file paths
-        self.init_file_paths()
+    # Sample folder structure
+    @cached_property
+    def sample_dir(self):
+        return self.project_dir / self.sample_id
 
-    def init_file_paths(self):
-        """
-        Define critical file paths used in the sample processing pipeline.
-        """
-        # zUMIs output files
-        self.gene_counts_fpath = self.stats_dir / f"{self.plate}.genecounts.txt"
-        self.reads_per_cell_fpath = self.stats_dir / f"{self.plate}.readspercell.txt"
-        self.umicount_inex_loom_fpath = (
-            self.expression_dir / f"{self.plate}.umicount.inex.all.loom"
-        )
-        self.bc_umi_stats_fpath = (
+    @cached_property
+    def zumis_output_dir(self):
+        return self.sample_dir / "zUMIs_output"
+
+    @cached_property
+    def stats_dir(self):
+        return self.zumis_output_dir / "stats"
+
+    @cached_property
+    def expression_dir(self):
+        return self.zumis_output_dir / "expression"
+
+    @cached_property
+    def fastq_files_dir(self):
+        return self.sample_dir / "fastq_files"
+
+    @cached_property
+    def plots_dir(self):
+        return self.sample_dir / "plots"
+
+    # zUMIs output files
+    @cached_property
+    def gene_counts_fpath(self):
+        return self.stats_dir / f"{self.plate}.genecounts.txt"
+
+    @cached_property
+    def reads_per_cell_fpath(self):
+        return self.stats_dir / f"{self.plate}.readspercell.txt"
+
+    @cached_property
+    def umicount_inex_loom_fpath(self):
+        return self.expression_dir / f"{self.plate}.umicount.inex.all.loom"
+
+    @cached_property
+    def bc_umi_stats_fpath(self):
+        return (
             self.zumis_output_dir
             / f"{self.plate}kept_barcodes_binned.txt.BCUMIstats.txt"
         )
-        self.zumis_log_fpath = self.sample_dir / f"{self.plate}.zUMIs_runlog.txt"
-        self.features_plot_fpath = self.stats_dir / f"{self.plate}.features.pdf"
 
-        # Files needed for processing
-        self.slurm_script_path = self.project_dir / f"{self.sample_id}_slurm_script.sh"
-        self.barcode_fpath = (
-            Path(self.config["smartseq3_dir"]) / "barcodes" / f"{self.barcode}.txt"
-        )
-        self.barcode_lookup_fpath = Path(self.config["barcode_lookup_path"])
+    @cached_property
+    def zumis_log_fpath(self):
+        return self.sample_dir / f"{self.plate}.zUMIs_runlog.txt"
+
+    @cached_property
+    def features_plot_fpath(self):
+        return self.stats_dir / f"{self.plate}.features.pdf"
+
+    # Files needed for processing
+    @cached_property
+    def slurm_script_path(self):
+        return self.project_dir / f"{self.sample_id}_slurm_script.sh"
 
-        # Report output files
-        self.umi_stats_fpath = self.stats_dir / f"{self.plate}.umi_stats.txt"
-        self.well_barcodes_fpath = self.stats_dir / f"{self.plate}.well_barcodes.txt"
-        # TODO: whether PDF or HTML should be decided by the report generator
-        self.report_fpath = self.zumis_output_dir / f"{self.plate}_SmartSeq3_report.pdf"
+    @cached_property
+    def barcode_fpath(self):
+        return Path(self.config["smartseq3_dir"]) / "barcodes" / f"{self.barcode}.txt"
+
+    @cached_property
+    def barcode_lookup_fpath(self):
+        return Path(self.config["barcode_lookup_path"])
+
+    # Report output files
+    @cached_property
+    def umi_stats_fpath(self):
+        return self.stats_dir / f"{self.plate}.umi_stats.txt"
+
+    @cached_property
+    def well_barcodes_fpath(self):
+        return self.stats_dir / f"{self.plate}.well_barcodes.txt"
+
+    # TODO: whether PDF or HTML should be decided by the report generator
+    @cached_property
+    def report_fpath(self):
+        return self.zumis_output_dir / f"{self.plate}_SmartSeq3_report.pdf"
 
     def ensure_barcode_file(self):
         """
@@ -168,9 +259,13 @@ class SampleFileHandler:
                 return None
 
             # Check the existence of reference files
-            if not idx_path.exists() or not gtf_path.exists():
+            idx_missing = not idx_path.exists()
+            gtf_missing = not gtf_path.exists()
+            if idx_missing or gtf_missing:
                 missing_files = "\n\t".join(
-                    [str(p) for p in [idx_path, gtf_path] if not p.exists()]
+                    str(p)
+                    for p, missing in ((idx_path, idx_missing), (gtf_path, gtf_missing))
+                    if missing
                 )
                 self._logger.warning(
                     f"Missing reference genome files: \n[\n\t{ missing_files }\n]"
@@ -191,36 +286,61 @@ class SampleFileHandler:
         Returns:
             dict or None: Dictionary of FASTQ file paths if all files are found, None otherwise.
         """
-        pattern = Path(
-            self.config["seq_root_dir"],
-            self.project_id,
-            self.sample_id,
-            "*",
-            self.flowcell_id,
-            f"{self.sample_id}_S*_*_*.f*q.gz",
+        base = os.path.join(
+            self.config["seq_root_dir"], self.project_id, self.sample_id
         )
-        file_paths = glob.glob(str(pattern))
-
-        for file_path in file_paths:
-            file = Path(file_path)
-            if file.name.endswith((".fastq.gz", ".fq.gz")):
-                if "_R1_" in file.stem:
-                    self.fastq_files["R1"] = file
-                elif "_R2_" in file.stem:
-                    self.fastq_files["R2"] = file
-                elif "_I1_" in file.stem:
-                    self.fastq_files["I1"] = file
-                elif "_I2_" in file.stem:
-                    self.fastq_files["I2"] = file
-
-        if not all(self.fastq_files.values()):
-            missing = [key for key, value in self.fastq_files.items() if value is None]
+        prefix = f"{self.sample_id}_S"
+        # Start from empty slots so a repeated call rescans instead of reusing stale paths
+        fastq_files = self.fastq_files = dict.fromkeys(self.fastq_files)
+        slots = len(fastq_files)
+        filled = 0
+
+        for entry in self._scan_flowcell_dirs(base):
+            if filled == slots:
+                break
+            name = entry.name
+            if not (name.startswith(prefix) and name.endswith((".fastq.gz", ".fq.gz"))):
+                continue
+            match = _FASTQ_SLOT_RE.search(name)
+            if match:
+                key = match.group(1)
+                if fastq_files[key] is None:
+                    filled += 1
+                fastq_files[key] = Path(entry.path)
+
+        if filled < slots:
+            missing = [key for key, value in fastq_files.items() if value is None]
             self._logger.warning(
-                f"Missing FASTQ files for {missing} in {Path(pattern).parent}"
+                f"Missing FASTQ files for {missing} in {base} (flowcell {self.flowcell_id})"
             )
             return None
 
-        return self.fastq_files
+        return fastq_files
+
+    def _scan_flowcell_dirs(self, base):
+        """
+        Yield the directory entries found under ``<base>/<run>/<flowcell_id>``.
+
+        Run directories without a readable flowcell subdirectory (or a missing base) are skipped.
+
+        Args:
+            base (str): The sample directory under the sequencing root.
+
+        Yields:
+            os.DirEntry: Entries of each matching flowcell directory.
+        """
+        try:
+            with os.scandir(base) as runs:
+                run_paths = [run.path for run in runs if run.is_dir()]
+        except OSError:
+            return
+
+        for run_path in run_paths:
+            try:
+                with os.scandir(os.path.join(run_path, self.flowcell_id)) as entries:
+                    yield from entries
+            except OSError:
+                continue
 
     def symlink_fastq_files(self):
         """
@@ -328,7 +448,7 @@ class SampleFileHandler:
         Returns:
             bool: True if the root directory and all expected files are found, False otherwise.
         """
-        if not (self.sample_dir.exists() and self.sample_dir.is_dir()):
+        if not self.sample_dir.is_dir():
             # TODO: In this case it might not make sense to continue, probably skip and report the issue (through Slack?)
             self._logger.error(
                 f"Sample {self.sample_id} directory does not exist: {self.sample_dir}"
@@ -344,9 +464,19 @@ class SampleFileHandler:
             self.features_plot_fpath,
         ]
 
+        # One directory listing per output dir instead of one stat per file
+        out_dirs = list(dict.fromkeys(file.parent for file in expected_files))
+        if self.config.get("network_fs", False):
+            # On networked filesystems, overlap the listing round-trips
+            with ThreadPoolExecutor(max_workers=len(out_dirs)) as executor:
+                listings = dict(zip(out_dirs, executor.map(_dir_entries, out_dirs)))
+        else:
+            listings = {out_dir: _dir_entries(out_dir) for out_dir in out_dirs}
         missing_files = [
-            file.name for file in expected_files if not file.exists()
-        ]  # or file.stat().st_size == 0]
+            file.name
+            for file in expected_files
+            if not _is_present(file, listings[file.parent])
+        ]
 
         if missing_files:
             missing_files_str = "\n\t".join(missing_files)
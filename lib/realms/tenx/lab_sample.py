@@ -4,14 +4,14 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
-from lib.core_utils.config_loader import ConfigLoader
 from lib.core_utils.logging_utils import custom_logger
+from lib.realms.tenx.utils.tenx_utils import TenXUtils
 
 
 class TenXLabSample:
     """Class representing a TenX lab sample."""
 
-    config: Mapping[str, Any] = ConfigLoader().load_config("10x_config.json")
+    config: Mapping[str, Any] = TenXUtils.get_config()
 
     def __init__(
         self,
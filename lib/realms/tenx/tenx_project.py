@@ -1,14 +1,16 @@
 import asyncio
 import logging
-from collections.abc import Mapping
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import Any
 
 from lib.base.abstract_project import AbstractProject
-from lib.core_utils.config_loader import ConfigLoader
 from lib.core_utils.logging_utils import custom_logger
 from lib.realms.tenx.lab_sample import TenXLabSample
 from lib.realms.tenx.run_sample import TenXRunSample
+from lib.realms.tenx.utils.tenx_utils import TenXUtils
 
 
 class TenXProject(AbstractProject):
@@ -16,7 +18,12 @@ class TenXProject(AbstractProject):
     Class representing a TenX project.
     """
 
-    config: Mapping[str, Any] = ConfigLoader().load_config("10x_config.json")
+    config: Mapping[str, Any] = TenXUtils.get_config()
+
+    # Required fields with their dotted paths split once, as (field, keys) pairs
+    _REQUIRED_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+        (field, tuple(field.split("."))) for field in config.get("required_fields", [])
+    )
 
     def __init__(
         self,
@@ -47,6 +54,22 @@ class TenXProject(AbstractProject):
             # Extract metadata from project document
             self.project_info: dict[str, Any] = self._extract_project_info()
 
+            # Resolve the feature maps once instead of once per sample
+            try:
+                feature_map = self.config["feature_map"]
+                self._feature_map_new: Mapping[str, str] = feature_map["new_format"]
+                self._feature_map_old: Mapping[str, str] = feature_map["old_format"]
+            except KeyError as e:
+                self._logger.error(
+                    f"Missing feature map {e} in the 10x config. Handle manually!"
+                )
+                self.proceed = False
+                return
+
+            self._old_feature_re: re.Pattern[str] | None = self._compile_old_feature_re(
+                self._feature_map_old
+            )
+
             if not self.determine_organism():
                 # TODO: Send this message as a notification (e.g. on Slack)
                 self._logger.error(
@@ -186,11 +209,14 @@ class TenXProject(AbstractProject):
         Returns:
             bool: True if all required fields are present, False otherwise.
         """
-        required_fields = self.config.get("required_fields", [])
-
-        missing_keys = [
-            field for field in required_fields if not self._is_field(field, self.doc)
-        ]
+        missing_keys = []
+        for field, keys in self._REQUIRED_FIELDS:
+            data: Any = self.doc
+            for key in keys:
+                if not isinstance(data, dict) or key not in data:
+                    missing_keys.append(field)
+                    break
+                data = data[key]
 
         if missing_keys:
             self._logger.warning(
@@ -200,24 +226,6 @@ class TenXProject(AbstractProject):
 
         return True
 
-    def _is_field(self, field_path: str, data: dict[str, Any]) -> bool:
-        """Checks if the document contains all required fields.
-
-        Args:
-            field_path (str): The path to the required field.
-            data (Dict[str, Any]): The dictionary to check.
-
-        Returns:
-            bool: True if the field exists, False otherwise.
-        """
-        keys = field_path.split(".")
-        for key in keys:
-            if isinstance(data, dict) and key in data:
-                data = data[key]
-            else:
-                return False
-        return True
-
     def ensure_project_directory(self) -> Path | None:
         """Ensures that the project directory exists. Creates it if necessary.
 
@@ -236,6 +244,26 @@ class TenXProject(AbstractProject):
             self._logger.error(f"Failed to create project directory: {e}")
             return None
 
+    @staticmethod
+    def _compile_old_feature_re(suffixes: Iterable[str]) -> re.Pattern[str] | None:
+        """Compile the old-format assay suffixes into a single regex.
+
+        A suffix matches when it follows an underscore and either ends the customer
+        name or is followed by another underscore (e.g. 'X_HTO' or 'X_HTO_rerun').
+        Longer suffixes are tried first, so 'A_VDJ-T' matches 'VDJ-T' over 'VDJ'.
+
+        Args:
+            suffixes (Iterable[str]): The assay suffixes of the old-format feature map.
+
+        Returns:
+            Optional[re.Pattern[str]]: The compiled regex, with the suffix as group 1,
+                or None if there are no suffixes.
+        """
+        ordered = sorted(suffixes, key=len, reverse=True)
+        if not ordered:
+            return None
+        return re.compile(r"_(" + "|".join(map(re.escape, ordered)) + r")(?:$|_)")
+
     def get_default_feature(self, library_prep_id: str) -> str:
         """Get a default feature based on the library preparation ID.
 
@@ -253,26 +281,6 @@ class TenXProject(AbstractProject):
         else:
             return "unknown"
 
-    def identify_feature_old_case(self, sample_info: dict[str, Any]) -> tuple[str, str]:
-        """Identify feature and original sample ID for old format cases.
-
-        Args:
-            sample_info (Dict[str, Any]): The sample information.
-
-        Returns:
-            Tuple[str, str]: A tuple containing the feature and original sample ID.
-        """
-        feature_map = self.config["feature_map"]["old_format"]
-        customer_name = sample_info.get("customer_name", "")
-        for assay_suffix, feature in feature_map.items():
-            suffix_with_underscore = f"_{assay_suffix}"
-            if suffix_with_underscore in customer_name:
-                original_sample_id = customer_name.split(suffix_with_underscore)[0]
-                return feature, original_sample_id
-        # Assign default values if not found
-        default_original_sample_id = customer_name or "unknown_sample_id"
-        return "unknown", default_original_sample_id
-
     def identify_feature_new_case(self, sample_id: str) -> tuple[str, str]:
         """Identify feature and original sample ID for new format cases.
 
@@ -282,9 +290,7 @@ class TenXProject(AbstractProject):
         Returns:
             Tuple[str, str]: A tuple containing the feature and original sample ID.
         """
-        feature_map = self.config["feature_map"]["new_format"]
-        assay_digit = sample_id[-1]
-        feature = feature_map.get(assay_digit, "unknown")
+        feature = self._feature_map_new.get(sample_id[-1], "unknown")
         default_original_sample_id = sample_id[:-1] or "unknown_sample_id"
         return feature, default_original_sample_id
 
@@ -297,35 +303,14 @@ class TenXProject(AbstractProject):
         Returns:
             Dict[str, Any]: Sample data excluding aborted samples.
         """
-        return {
-            sample_id: sample_info
-            for sample_id, sample_info in sample_data.items()
-            if sample_info.get("details", {}).get("status_(manual)", "").lower()
-            != "aborted"
-        }
-
-    def identify_feature_and_original_id_old(
-        self, sample_id: str, sample_info: dict[str, Any]
-    ) -> tuple[str, str]:
-        """Identify feature and original sample ID for old format samples.
-
-        Args:
-            sample_id (str): The sample ID.
-            sample_info (Dict[str, Any]): The sample information.
-
-        Returns:
-            Tuple[str, str]: A tuple containing the feature and original sample ID.
-        """
-        feature, original_sample_id = self.identify_feature_old_case(sample_info)
-        if feature != "unknown":
-            return feature, original_sample_id
-        else:
-            # Handle original samples without features
-            library_prep_option = self.project_info.get("library_prep_option", "")
-            feature = self.get_default_feature(library_prep_option)
-            # NOTE: If you want to name samples with the customer name, comment out the line below
-            original_sample_id = sample_id
-            return feature, original_sample_id
+        filtered = {}
+        for sample_id, sample_info in sample_data.items():
+            details = sample_info.get("details")
+            status = details.get("status_(manual)") if details else None
+            if status and status.lower() == "aborted":
+                continue
+            filtered[sample_id] = sample_info
+        return filtered
 
     def identify_feature_and_original_id_new(self, sample_id: str) -> tuple[str, str]:
         """Identify feature and original sample ID for new format samples.
@@ -358,23 +343,60 @@ class TenXProject(AbstractProject):
             Dict[str, Tuple[TenXLabSample, str]]: A dictionary mapping sample IDs
                 to lab sample instances and original IDs.
         """
+        if self.case_type == "old_format":
+            return self._create_lab_samples_old(sample_data)
+
         lab_samples = {}
         for sample_id, sample_info in sample_data.items():
-            if self.case_type == "old_format":
-                feature, original_sample_id = self.identify_feature_and_original_id_old(
-                    sample_id, sample_info
-                )
-            else:
-                feature, original_sample_id = self.identify_feature_and_original_id_new(
-                    sample_id
-                )
-
+            feature, original_sample_id = self.identify_feature_and_original_id_new(
+                sample_id
+            )
             lab_sample = TenXLabSample(
                 sample_id, feature, sample_info, self.project_info
             )
             lab_samples[sample_id] = (lab_sample, original_sample_id)
         return lab_samples
 
+    def _create_lab_samples_old(
+        self, sample_data: dict[str, Any]
+    ) -> dict[str, tuple[TenXLabSample, str]]:
+        """Create lab samples for old format cases.
+
+        The feature is read from the assay suffix of the customer name, using the
+        compiled suffix regex. Samples without a known suffix get the default feature
+        of the library prep option and keep their own sample ID.
+
+        Args:
+            sample_data (Dict[str, Any]): The sample data.
+
+        Returns:
+            Dict[str, Tuple[TenXLabSample, str]]: A dictionary mapping sample IDs
+                to lab sample instances and original IDs.
+        """
+        search = self._old_feature_re.search if self._old_feature_re else None
+        feature_map = self._feature_map_old
+        project_info = self.project_info
+        default_feature = self.get_default_feature(
+            project_info.get("library_prep_option", "")
+        )
+
+        lab_samples = {}
+        for sample_id, sample_info in sample_data.items():
+            customer_name = sample_info.get("customer_name", "")
+            match = search(customer_name) if search else None
+            if match:
+                feature = feature_map[match.group(1)]
+                original_sample_id = customer_name[: match.start()]
+            else:
+                # Handle original samples without features
+                feature = default_feature
+                # NOTE: If you want to name samples with the customer name, use customer_name here
+                original_sample_id = sample_id
+
+            lab_sample = TenXLabSample(sample_id, feature, sample_info, project_info)
+            lab_samples[sample_id] = (lab_sample, original_sample_id)
+        return lab_samples
+
     def group_lab_samples(
         self, lab_samples: dict[str, tuple[TenXLabSample, str]]
     ) -> dict[str, list[TenXLabSample]]:
@@ -386,10 +408,10 @@ class TenXProject(AbstractProject):
         Returns:
             Dict[str, List[TenXLabSample]]: A dictionary grouping lab samples by original sample ID.
         """
-        groups: dict[str, list[TenXLabSample]] = {}
+        groups: defaultdict[str, list[TenXLabSample]] = defaultdict(list)
         for lab_sample, original_sample_id in lab_samples.values():
-            groups.setdefault(original_sample_id, []).append(lab_sample)
-        return groups
+            groups[original_sample_id].append(lab_sample)
+        return dict(groups)
 
     def create_run_samples(
         self, grouped_lab_samples: dict[str, list[TenXLabSample]]
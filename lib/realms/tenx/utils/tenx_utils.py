@@ -1,15 +1,46 @@
+import functools
 import json
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from lib.core_utils.common import YggdrasilUtilities as Ygg
+from lib.core_utils.config_loader import ConfigLoader
 from lib.core_utils.logging_utils import custom_logger
 
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = custom_logger(__name__)
 
+# Decision table entries keyed by (library_prep_method, features)
+_DecisionIndex = dict[tuple[str | None, frozenset[str]], dict[str, Any]]
+
 
 class TenXUtils:
     """Utility class for TenX processing."""
 
+    # Indexed decision tables per file name. Only successful, non-empty loads are kept.
+    _decision_indexes: dict[str, _DecisionIndex] = {}
+
+    @staticmethod
+    @functools.cache
+    def get_config() -> Mapping[str, Any]:
+        """
+        Load the 10x realm configuration once per process.
+
+        Shared by the TenX project and lab sample classes, which therefore hold
+        the same mapping object.
+
+        Returns:
+            Mapping[str, Any]: The read-only 10x configuration.
+        """
+        return ConfigLoader().load_config("10x_config.json")
+
     @staticmethod
     def load_decision_table(file_name: str) -> list[dict[str, Any]]:
         """
@@ -28,12 +59,12 @@ class TenXUtils:
             return []
 
         try:
-            with open(config_file) as f:
-                decision_table = json.load(f)
-                if not isinstance(decision_table, list):
-                    logger.error(f"Decision table '{file_name}' is not a list.")
-                    return []
-                return decision_table
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handling below covers both
+            decision_table = _json_loads(config_file.read_bytes())
+            if not isinstance(decision_table, list):
+                logger.error(f"Decision table '{file_name}' is not a list.")
+                return []
+            return decision_table
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing decision table '{file_name}': {e}")
             return []
@@ -41,6 +72,37 @@ class TenXUtils:
             logger.error(f"Unexpected error loading decision table '{file_name}': {e}")
             return []
 
+    @staticmethod
+    def _decision_index(file_name: str) -> _DecisionIndex:
+        """
+        Index the decision table by library prep method and feature set.
+
+        The index is cached per file name once the table loads with at least one
+        entry. Failed or empty loads are retried on the next call.
+
+        Args:
+            file_name (str): The name of the decision table JSON file.
+
+        Returns:
+            Dict[Tuple[Optional[str], FrozenSet[str]], Dict[str, Any]]: Decision table
+                entries keyed by (library_prep_method, features). The first entry wins
+                if several share a key.
+        """
+        cached = TenXUtils._decision_indexes.get(file_name)
+        if cached is not None:
+            return cached
+
+        index: _DecisionIndex = {}
+        for entry in TenXUtils.load_decision_table(file_name):
+            key = (
+                entry.get("library_prep_method"),
+                frozenset(entry.get("features", [])),
+            )
+            index.setdefault(key, entry)
+        if index:
+            TenXUtils._decision_indexes[file_name] = index
+        return index
+
     @staticmethod
     def get_pipeline_info(
         library_prep_method: str, features: list[str]
@@ -55,11 +117,11 @@ class TenXUtils:
             Optional[Dict[str, Any]]: A dictionary containing pipeline information if found,
                 None otherwise.
         """
-        for entry in TenXUtils.load_decision_table("10x_decision_table.json"):
-            if entry.get("library_prep_method") == library_prep_method and set(
-                entry.get("features", [])
-            ) == set(features):
-                return entry
+        entry = TenXUtils._decision_index("10x_decision_table.json").get(
+            (library_prep_method, frozenset(features))
+        )
+        if entry is not None:
+            return entry
         logger.warning(
             f"No pipeline information found for library_prep_method '{library_prep_method}' "
             f"and features '{features}'."
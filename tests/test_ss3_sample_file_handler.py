@@ -0,0 +1,221 @@
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from lib.realms.smartseq3.utils.sample_file_handler import SampleFileHandler
+
+
+def _make_handler(tmp_path, flowcell_id="FC1", **config):
+    sample = SimpleNamespace(
+        id="P12345_101",
+        flowcell_id=flowcell_id,
+        barcode="BC1",
+        project_info={
+            "project_id": "P12345",
+            "project_name": "Test_Project",
+            "project_dir": tmp_path / "projects" / "Test_Project",
+        },
+        config={
+            "seq_root_dir": str(tmp_path / "seq_root"),
+            "smartseq3_dir": str(tmp_path / "ss3"),
+            "barcode_lookup_path": str(tmp_path / "lookup.csv"),
+            **config,
+        },
+    )
+    return SampleFileHandler(sample)
+
+
+class TestSS3SampleFileHandlerLocateFastq(unittest.TestCase):
+    """Tests for FASTQ discovery in the SmartSeq3 SampleFileHandler."""
+
+    def setUp(self):
+        self._tmpdir = TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        self.sample_root = self.tmp_path / "seq_root" / "P12345" / "P12345_101"
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _make_handler(self, flowcell_id="FC1"):
+        return _make_handler(self.tmp_path, flowcell_id=flowcell_id)
+
+    def _make_fastqs(
+        self, run="run1", flowcell_id="FC1", reads=("R1", "R2", "I1", "I2")
+    ):
+        flowcell_dir = self.sample_root / run / flowcell_id
+        flowcell_dir.mkdir(parents=True, exist_ok=True)
+        for read in reads:
+            (flowcell_dir / f"P12345_101_S1_L001_{read}_001.fastq.gz").touch()
+        return flowcell_dir
+
+    def test_all_reads_found(self):
+        flowcell_dir = self._make_fastqs()
+
+        fastq_files = self._make_handler().locate_fastq_files()
+
+        self.assertEqual(
+            fastq_files,
+            {
+                read: flowcell_dir / f"P12345_101_S1_L001_{read}_001.fastq.gz"
+                for read in ("R1", "R2", "I1", "I2")
+            },
+        )
+        for value in fastq_files.values():
+            self.assertIsInstance(value, Path)
+
+    def test_missing_read_slot(self):
+        self._make_fastqs(reads=("R1", "R2", "I1"))
+        handler = self._make_handler()
+
+        self.assertIsNone(handler.locate_fastq_files())
+        self.assertIsNone(handler.fastq_files["I2"])
+        # Slots that were found keep Path values
+        self.assertIsInstance(handler.fastq_files["R1"], Path)
+
+    def test_repeated_call_rescans(self):
+        flowcell_dir = self._make_fastqs()
+        handler = self._make_handler()
+        self.assertIsNotNone(handler.locate_fastq_files())
+
+        (flowcell_dir / "P12345_101_S1_L001_I2_001.fastq.gz").unlink()
+
+        self.assertIsNone(handler.locate_fastq_files())
+        self.assertIsNone(handler.fastq_files["I2"])
+
+    def test_missing_flowcell_dir(self):
+        self._make_fastqs(flowcell_id="FC1")
+
+        self.assertIsNone(self._make_handler(flowcell_id="FC2").locate_fastq_files())
+
+    def test_missing_sample_dir(self):
+        self.assertIsNone(self._make_handler().locate_fastq_files())
+
+    def test_prefix_and_extension_filtering(self):
+        flowcell_dir = self._make_fastqs(reads=("R2", "I1", "I2"))
+        # Wrong sample prefix and wrong extension must both be ignored
+        (flowcell_dir / "P12345_102_S1_L001_R1_001.fastq.gz").touch()
+        (flowcell_dir / "P12345_101_S1_L001_R1_001.fastq").touch()
+
+        self.assertIsNone(self._make_handler().locate_fastq_files())
+
+        (flowcell_dir / "P12345_101_S1_L001_R1_001.fq.gz").touch()
+        fastq_files = self._make_handler().locate_fastq_files()
+        self.assertEqual(
+            fastq_files["R1"], flowcell_dir / "P12345_101_S1_L001_R1_001.fq.gz"
+        )
+
+    def test_symlinked_run_dir_is_followed(self):
+        # The run directory lives elsewhere and is only linked into the sample dir
+        real_flowcell = self.tmp_path / "elsewhere" / "run1" / "FC1"
+        real_flowcell.mkdir(parents=True)
+        for read in ("R1", "R2", "I1", "I2"):
+            (real_flowcell / f"P12345_101_S1_L001_{read}_001.fastq.gz").touch()
+        self.sample_root.mkdir(parents=True)
+        os.symlink(real_flowcell.parent, self.sample_root / "run1")
+
+        fastq_files = self._make_handler().locate_fastq_files()
+
+        self.assertIsNotNone(fastq_files)
+        self.assertEqual(
+            fastq_files["R1"],
+            self.sample_root / "run1" / "FC1" / "P12345_101_S1_L001_R1_001.fastq.gz",
+        )
+
+    def test_flowcell_name_is_a_file(self):
+        run_dir = self.sample_root / "run1"
+        run_dir.mkdir(parents=True)
+        (run_dir / "FC1").touch()
+
+        self.assertIsNone(self._make_handler().locate_fastq_files())
+
+
+class TestSS3SampleFileHandlerOutputValid(unittest.TestCase):
+    """Tests for zUMIs output validation in the SmartSeq3 SampleFileHandler."""
+
+    def setUp(self):
+        self._tmpdir = TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        self.handler = self._make_handler()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _make_handler(self, **config):
+        return _make_handler(self.tmp_path, **config)
+
+    def _expected_files(self, handler):
+        return [
+            handler.gene_counts_fpath,
+            handler.reads_per_cell_fpath,
+            handler.umicount_inex_loom_fpath,
+            handler.bc_umi_stats_fpath,
+            handler.zumis_log_fpath,
+            handler.features_plot_fpath,
+        ]
+
+    def _make_outputs(self, skip=()):
+        for fpath in self._expected_files(self.handler):
+            if fpath in skip:
+                continue
+            fpath.parent.mkdir(parents=True, exist_ok=True)
+            fpath.touch()
+
+    def test_all_present(self):
+        self._make_outputs()
+
+        self.assertTrue(self.handler.is_output_valid())
+
+    def test_one_missing(self):
+        self._make_outputs(skip=(self.handler.features_plot_fpath,))
+
+        self.assertFalse(self.handler.is_output_valid())
+
+    def test_sample_dir_missing(self):
+        self.assertFalse(self.handler.is_output_valid())
+
+    def test_dangling_symlink_is_missing(self):
+        self._make_outputs(skip=(self.handler.features_plot_fpath,))
+        os.symlink(self.tmp_path / "nowhere.pdf", self.handler.features_plot_fpath)
+
+        self.assertFalse(self.handler.is_output_valid())
+
+    def test_valid_symlink_is_present(self):
+        self._make_outputs(skip=(self.handler.features_plot_fpath,))
+        target = self.tmp_path / "features.pdf"
+        target.touch()
+        os.symlink(target, self.handler.features_plot_fpath)
+
+        self.assertTrue(self.handler.is_output_valid())
+
+    def test_unlistable_dir_falls_back_to_stat(self):
+        self._make_outputs()
+        stats_dir = str(self.handler.stats_dir)
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if str(path) == stats_dir:
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        with patch(
+            "lib.realms.smartseq3.utils.sample_file_handler.os.scandir",
+            side_effect=scandir,
+        ):
+            self.assertTrue(self.handler.is_output_valid())
+
+
+class TestSS3SampleFileHandlerOutputValidNetworkFs(TestSS3SampleFileHandlerOutputValid):
+    """Run the output validation tests with ``network_fs`` enabled."""
+
+    def _make_handler(self, **config):
+        return _make_handler(self.tmp_path, network_fs=True, **config)
+
+    def test_network_fs_enabled(self):
+        self.assertTrue(self.handler.config["network_fs"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from lib.realms.tenx.tenx_project import TenXProject
+
+
+class TestTenXProjectOldFormatFeatures(unittest.TestCase):
+    """Tests for old-format assay suffix matching in TenXProject."""
+
+    FEATURE_MAP_OLD = {
+        "HTO": "hashing",
+        "CITE": "cite",
+        "VDJ": "vdj",
+        "VDJ-T": "vdj-t",
+    }
+
+    def setUp(self):
+        # Bypass __init__ (DB manager, config checks); set only what the lab sample step reads
+        self.project = TenXProject.__new__(TenXProject)
+        self.project.case_type = "old_format"
+        self.project.project_info = {"library_prep_option": "3' GEX"}
+        self.project._feature_map_old = self.FEATURE_MAP_OLD
+        self.project._old_feature_re = TenXProject._compile_old_feature_re(
+            self.FEATURE_MAP_OLD
+        )
+
+        patcher = patch("lib.realms.tenx.tenx_project.TenXLabSample")
+        self.mock_lab_sample = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _identify(self, customer_name, sample_id="P1_101"):
+        lab_samples = self.project.create_lab_samples(
+            {sample_id: {"customer_name": customer_name}}
+        )
+        _, original_sample_id = lab_samples[sample_id]
+        feature = self.mock_lab_sample.call_args.args[1]
+        return feature, original_sample_id
+
+    def test_suffix_at_end(self):
+        self.assertEqual(self._identify("X1_HTO"), ("hashing", "X1"))
+
+    def test_suffix_followed_by_underscore(self):
+        self.assertEqual(self._identify("X1_HTO_rerun"), ("hashing", "X1"))
+
+    def test_suffix_must_be_delimited(self):
+        # 'HTOfoo' is not an assay suffix; fall back to the default feature
+        self.assertEqual(self._identify("X1_HTOfoo"), ("gex", "P1_101"))
+
+    def test_longest_suffix_wins(self):
+        self.assertEqual(self._identify("A_VDJ-T"), ("vdj-t", "A"))
+        self.assertEqual(self._identify("A_VDJ"), ("vdj", "A"))
+
+    def test_original_id_cut_at_first_match(self):
+        self.assertEqual(self._identify("A_B_CITE_HTO"), ("cite", "A_B"))
+
+    def test_no_suffix_uses_default_feature(self):
+        self.assertEqual(self._identify("X1"), ("gex", "P1_101"))
+        self.assertEqual(self._identify(""), ("gex", "P1_101"))
+
+    def test_empty_feature_map(self):
+        self.project._feature_map_old = {}
+        self.project._old_feature_re = TenXProject._compile_old_feature_re({})
+
+        self.assertIsNone(self.project._old_feature_re)
+        self.assertEqual(self._identify("X1_HTO"), ("gex", "P1_101"))
+
+    def test_suffixes_are_escaped(self):
+        pattern = TenXProject._compile_old_feature_re(["A.B"])
+
+        self.assertIsNotNone(pattern)
+        self.assertIsNone(pattern.search("X_AxB"))
+        self.assertIsNotNone(pattern.search("X_A.B"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from lib.realms.tenx.utils.tenx_utils import TenXUtils
+
+GEX = {"library_prep_method": "3' GEX", "features": ["gex"], "pipeline": "count"}
+GEX_HASHING = {
+    "library_prep_method": "3' GEX",
+    "features": ["gex", "hashing"],
+    "pipeline": "multi",
+}
+
+
+class TestTenXUtilsGetPipelineInfo(unittest.TestCase):
+    """Tests for decision table lookups in TenXUtils.get_pipeline_info."""
+
+    def setUp(self):
+        TenXUtils._decision_indexes.clear()
+        self._tmpdir = TemporaryDirectory()
+        self.table_path = Path(self._tmpdir.name) / "10x_decision_table.json"
+
+        patcher = patch(
+            "lib.realms.tenx.utils.tenx_utils.Ygg.get_path",
+            return_value=self.table_path,
+        )
+        self.mock_get_path = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        TenXUtils._decision_indexes.clear()
+        self._tmpdir.cleanup()
+
+    def _write_table(self, entries):
+        self.table_path.write_text(json.dumps(entries))
+
+    def test_match(self):
+        self._write_table([GEX, GEX_HASHING])
+
+        self.assertEqual(TenXUtils.get_pipeline_info("3' GEX", ["gex"]), GEX)
+        self.assertEqual(
+            TenXUtils.get_pipeline_info("3' GEX", ["gex", "hashing"]), GEX_HASHING
+        )
+
+    def test_no_match(self):
+        self._write_table([GEX])
+
+        self.assertIsNone(TenXUtils.get_pipeline_info("5' GEX", ["gex"]))
+        self.assertIsNone(TenXUtils.get_pipeline_info("3' GEX", ["gex", "cite"]))
+
+    def test_feature_order_does_not_matter(self):
+        self._write_table([GEX_HASHING])
+
+        self.assertEqual(
+            TenXUtils.get_pipeline_info("3' GEX", ["hashing", "gex"]), GEX_HASHING
+        )
+
+    def test_first_duplicate_wins(self):
+        duplicate = {**GEX, "features": ["gex"], "pipeline": "other"}
+        self._write_table([GEX, duplicate])
+
+        self.assertEqual(TenXUtils.get_pipeline_info("3' GEX", ["gex"]), GEX)
+
+    def test_malformed_table_is_retried(self):
+        self.table_path.write_text("[{not json")
+
+        self.assertIsNone(TenXUtils.get_pipeline_info("3' GEX", ["gex"]))
+        self.assertNotIn("10x_decision_table.json", TenXUtils._decision_indexes)
+
+        self._write_table([GEX])
+
+        self.assertEqual(TenXUtils.get_pipeline_info("3' GEX", ["gex"]), GEX)
+
+    def test_missing_table(self):
+        self.mock_get_path.return_value = None
+
+        self.assertIsNone(TenXUtils.get_pipeline_info("3' GEX", ["gex"]))
+
+    def test_valid_table_is_cached(self):
+        self._write_table([GEX])
+        TenXUtils.get_pipeline_info("3' GEX", ["gex"])
+        self.table_path.unlink()
+
+        self.assertEqual(TenXUtils.get_pipeline_info("3' GEX", ["gex"]), GEX)
+        self.assertEqual(self.mock_get_path.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()